@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 from pathlib import Path
 
@@ -12,19 +13,55 @@ SOUNDS_DIR = Path(__file__).resolve().parent.parent / "sounds"
 SUCCESS_SOUND = SOUNDS_DIR / "success.mp3"
 ERROR_SOUND = SOUNDS_DIR / "error.mp3"
 
+# Redirect stdin/stdout/stderr of spawned players to /dev/null
+_DEVNULL_FILE_ACTIONS = (
+    [
+        (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+    ]
+    if hasattr(os, "posix_spawnp")
+    else None
+)
+
+# Sound files already seen on disk; missing ones are re-checked so they can be added later
+_sounds_found: set[Path] = set()
+
+# Pids of spawned players not yet reaped
+_sound_pids: list[int] = []
+
+
+def _reap_finished() -> None:
+    """Collect exit status of finished players so they don't linger as zombies."""
+    for pid in list(_sound_pids):
+        try:
+            done, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            done = pid
+        if done:
+            _sound_pids.remove(pid)
+
 
 def play_sound(path: Path) -> None:
     """Play an audio file in the background (non-blocking)."""
-    if not path.exists():
-        logger.debug("Sound file not found: %s", path)
-        return
+    if path not in _sounds_found:
+        if not path.exists():
+            logger.debug("Sound file not found: %s", path)
+            return
+        _sounds_found.add(path)
+    _reap_finished()
+    args = ["mpv", "--no-video", "--really-quiet", str(path)]
     try:
-        subprocess.Popen(
-            ["mpv", "--no-video", "--really-quiet", str(path)],
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        if _DEVNULL_FILE_ACTIONS is not None:
+            # posix_spawnp skips Popen's fork/exec bookkeeping; fds are close-on-exec by default
+            _sound_pids.append(os.posix_spawnp("mpv", args, os.environ, file_actions=_DEVNULL_FILE_ACTIONS))
+        else:
+            subprocess.Popen(
+                args,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
     except FileNotFoundError:
         logger.debug("mpv not found for audio playback")
     except Exception as e:
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 import sqlite3
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 DEFAULT_DB_PATH = DEFAULT_DATA_DIR / "videoplayer.db"
 DEFAULT_CACHE_DIR = DEFAULT_DATA_DIR / "cache"
@@ -18,6 +22,14 @@ DEFAULT_WEB_PORT = 8080
 DEFAULT_DEBUG_MODE = False
 DEFAULT_DISPLAY_CONNECTORS = ""  # Empty = default display; comma-separated for multi-HDMI e.g. "0.HDMI-A-1,1.HDMI-A-2"
 
+# One long-lived connection per database file, shared by the scanner loop and web threads
+_connections: dict[Path, sqlite3.Connection] = {}
+_conn_lock = threading.Lock()
+
+# Loaded config per database file; config only changes through save_config
+_config_cache: dict[Path, AppConfig] = {}
+_cache_lock = threading.Lock()
+
 
 @dataclass
 class AppConfig:
@@ -48,6 +60,43 @@ def _ensure_data_dir(db_path: Path) -> None:
     (db_path.parent / "cache").mkdir(exist_ok=True)
 
 
+def _connect(path: Path) -> sqlite3.Connection:
+    """Open a connection to the database with WAL journaling and tuned pragmas."""
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    try:
+        # journal_mode is persistent per database file; the others are per connection
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+    except sqlite3.Error as e:
+        logger.debug("Could not apply SQLite pragmas to %s: %s", path, e)
+    return conn
+
+
+def _get_conn(path: Path) -> sqlite3.Connection:
+    """
+    Return the shared connection for path, opening it on first use. Caller must hold _conn_lock.
+
+    The schema is created once when the connection is opened.
+    """
+    conn = _connections.get(path)
+    if conn is None:
+        conn = _connect(path)
+        _init_schema(conn)
+        _connections[path] = conn
+    return conn
+
+
+def close_connections() -> None:
+    """Close all shared database connections (e.g. at shutdown or between tests)."""
+    with _conn_lock:
+        for conn in _connections.values():
+            conn.close()
+        _connections.clear()
+
+
 def _init_schema(conn: sqlite3.Connection) -> None:
     """Create tables if they don't exist."""
     conn.executescript("""
@@ -96,22 +145,26 @@ def get_db_path() -> Path:
 
 
 def load_config(db_path: Optional[Path] = None) -> AppConfig:
-    """Load config from SQLite. Returns defaults if no config exists."""
+    """Load config from SQLite. Returns defaults if no config exists. Cached until the next save."""
     path = db_path or get_db_path()
-    _ensure_data_dir(path)
+    with _cache_lock:
+        cached = _config_cache.get(path)
+    if cached is not None:
+        return replace(cached)
 
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    _init_schema(conn)
-
-    rows = conn.execute("SELECT key, value FROM config").fetchall()
-    conn.close()
+    _ensure_data_dir(path)
+    with _conn_lock:
+        conn = _get_conn(path)
+        rows = conn.execute("SELECT key, value FROM config").fetchall()
 
     if not rows:
-        return AppConfig.defaults()
-
-    d = {row["key"]: row["value"] for row in rows}
-    return _dict_to_config(d)
+        config = AppConfig.defaults()
+    else:
+        d = {row["key"]: row["value"] for row in rows}
+        config = _dict_to_config(d)
+    with _cache_lock:
+        _config_cache[path] = replace(config)
+    return config
 
 
 def save_config(config: AppConfig, db_path: Optional[Path] = None) -> None:
@@ -119,16 +172,21 @@ def save_config(config: AppConfig, db_path: Optional[Path] = None) -> None:
     path = db_path or get_db_path()
     _ensure_data_dir(path)
 
-    conn = sqlite3.connect(path)
-    _init_schema(conn)
+    with _conn_lock:
+        conn = _get_conn(path)
+        with conn:  # All keys in one transaction, one statement parse
+            conn.executemany(
+                "INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
+                _config_to_dict(config).items(),
+            )
+    with _cache_lock:
+        _config_cache[path] = replace(config)
 
-    for key, value in _config_to_dict(config).items():
-        conn.execute(
-            "INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)",
-            (key, value),
-        )
-    conn.commit()
-    conn.close()
+
+def invalidate_config_cache() -> None:
+    """Drop cached config so the next load_config reads from SQLite (e.g. in tests)."""
+    with _cache_lock:
+        _config_cache.clear()
 
 
 def add_view(
@@ -141,43 +199,72 @@ def add_view(
     import time
 
     path = db_path or get_db_path()
-    conn = sqlite3.connect(path)
-    _init_schema(conn)
-    conn.execute(
-        "INSERT INTO view_history (viewed_at, video_id, platform, original_url) VALUES (?, ?, ?, ?)",
-        (time.time(), video_id, platform, original_url or ""),
-    )
-    conn.commit()
-    conn.close()
+    with _conn_lock:
+        conn = _get_conn(path)
+        conn.execute(
+            "INSERT INTO view_history (viewed_at, video_id, platform, original_url) VALUES (?, ?, ?, ?)",
+            (time.time(), video_id, platform, original_url or ""),
+        )
+        conn.commit()
+
+
+def check_and_record(
+    video_id: str,
+    platform: str,
+    original_url: Optional[str],
+    max_videos: int,
+    since_timestamp: float,
+    db_path: Optional[Path] = None,
+) -> bool:
+    """
+    Record a view only if fewer than max_videos were recorded since the given timestamp.
+
+    The count and insert run in a single IMMEDIATE transaction. Returns True if recorded.
+    """
+    import time
+
+    path = db_path or get_db_path()
+    with _conn_lock:
+        conn = _get_conn(path)
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT COUNT(*) as cnt FROM view_history WHERE viewed_at >= ?",
+                (since_timestamp,),
+            ).fetchone()
+            if row and row[0] >= max_videos:
+                return False
+            conn.execute(
+                "INSERT INTO view_history (viewed_at, video_id, platform, original_url) VALUES (?, ?, ?, ?)",
+                (time.time(), video_id, platform, original_url or ""),
+            )
+    return True
 
 
 def count_views_since(since_timestamp: float, db_path: Optional[Path] = None) -> int:
     """Count views since the given timestamp."""
     path = db_path or get_db_path()
-    conn = sqlite3.connect(path)
-    _init_schema(conn)
-    row = conn.execute(
-        "SELECT COUNT(*) as cnt FROM view_history WHERE viewed_at >= ?",
-        (since_timestamp,),
-    ).fetchone()
-    conn.close()
+    with _conn_lock:
+        conn = _get_conn(path)
+        row = conn.execute(
+            "SELECT COUNT(*) as cnt FROM view_history WHERE viewed_at >= ?",
+            (since_timestamp,),
+        ).fetchone()
     return row[0] if row else 0
 
 
 def get_recent_views(limit: int = 50, db_path: Optional[Path] = None) -> list[dict]:
     """Get recent view history for the dashboard."""
     path = db_path or get_db_path()
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    _init_schema(conn)
-    rows = conn.execute(
-        """
-        SELECT viewed_at, video_id, platform, original_url
-        FROM view_history
-        ORDER BY viewed_at DESC
-        LIMIT ?
-        """,
-        (limit,),
-    ).fetchall()
-    conn.close()
+    with _conn_lock:
+        conn = _get_conn(path)
+        rows = conn.execute(
+            """
+            SELECT viewed_at, video_id, platform, original_url
+            FROM view_history
+            ORDER BY viewed_at DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
     return [dict(r) for r in rows]
@@ -2,71 +2,79 @@
 
 from __future__ import annotations
 
-import json
 import logging
-import socket
 import threading
 import time
 from collections import deque
+from typing import Optional
+
+from .config import load_config
+from .video_service import _mpv_ipc_send
 
 logger = logging.getLogger(__name__)
 
 MAX_LINES = 10
-OSD_UPDATE_INTERVAL = 2.0  # seconds
+OSD_UPDATE_INTERVAL = 2.0  # seconds (coalesces bursts of messages into one update)
 OSD_DURATION = 30  # seconds (mpv show-text duration)
+OSD_REFRESH_INTERVAL = OSD_DURATION - 5  # seconds (re-show unchanged text before it expires)
+DEBUG_MODE_REFRESH_INTERVAL = 30.0  # seconds
 
+# No lock needed: single append/clear/list() calls on a deque are atomic under the GIL
 _log_buffer: deque[str] = deque(maxlen=MAX_LINES)
-_lock = threading.Lock()
+_dirty = threading.Event()
 
 
 def add(msg: str) -> None:
     """Add a debug message to the buffer."""
-    with _lock:
-        _log_buffer.append(msg)
+    _log_buffer.append(msg)
+    _dirty.set()
 
 
 def get_lines() -> list[str]:
     """Get the current log lines (newest last)."""
-    with _lock:
-        return list(_log_buffer)
+    return list(_log_buffer)
 
 
 def clear() -> None:
     """Clear the log buffer."""
-    with _lock:
-        _log_buffer.clear()
+    _log_buffer.clear()
 
 
 def _mpv_show_text(sock_path: str, text: str) -> None:
-    """Send show-text command to mpv via IPC."""
-    try:
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.settimeout(2.0)
-        sock.connect(sock_path)
-        msg = json.dumps({"command": ["show-text", text, OSD_DURATION * 1000]}) + "\n"
-        sock.sendall(msg.encode())
-        sock.close()
-    except Exception:
-        pass
+    """Send show-text command to mpv via IPC (pooled connection shared with video_service)."""
+    _mpv_ipc_send(sock_path, ["show-text", text, OSD_DURATION * 1000])
 
 
 def run_osd_updater(sock_path: str, db_path=None) -> None:
     """
-    Background thread that periodically updates mpv OSD with debug log.
+    Background thread that updates mpv OSD with debug log when new messages arrive.
     Runs until the process exits.
     """
+    debug_mode = False
+    debug_mode_checked_at = float("-inf")
+    last_text: Optional[str] = None
+    last_sent_at = float("-inf")
+
     while True:
+        # Wake on new messages, or periodically to keep the OSD text from expiring
+        _dirty.wait(timeout=OSD_REFRESH_INTERVAL)
+        _dirty.clear()
         time.sleep(OSD_UPDATE_INTERVAL)
         try:
-            from .config import load_config
-
-            config = load_config(db_path)
-            if not config.debug_mode:
+            now = time.monotonic()
+            if now - debug_mode_checked_at >= DEBUG_MODE_REFRESH_INTERVAL:
+                debug_mode = load_config(db_path).debug_mode
+                debug_mode_checked_at = now
+            if not debug_mode:
                 continue
             lines = get_lines()
             if not lines:
                 continue
             text = "\n".join(lines)
+            if text == last_text and now - last_sent_at < OSD_REFRESH_INTERVAL:
+                continue
             _mpv_show_text(sock_path, text)
+            last_text = text
+            last_sent_at = now
         except Exception as e:
             logger.debug("OSD updater error: %s", e)
@@ -11,10 +11,14 @@ logger = logging.getLogger(__name__)
 
 IDLE_IMAGE_NAME = "idle.png"
 IDLE_IMAGE_FALLBACK = "idle.ppm"
+BUNDLED_IDLE_IMAGE = Path(__file__).resolve().parent.parent / "images" / IDLE_IMAGE_NAME
 
 
 def get_idle_image_path() -> Path:
-    """Return path to idle image, creating it if needed."""
+    """Return path to idle image: the bundled one if present, otherwise generated on first use."""
+    if BUNDLED_IDLE_IMAGE.exists():
+        return BUNDLED_IDLE_IMAGE
+
     data_dir = DEFAULT_DATA_DIR
     data_dir.mkdir(parents=True, exist_ok=True)
     path = data_dir / IDLE_IMAGE_NAME
@@ -64,6 +68,8 @@ def _create_minimal_black_png(path: Path) -> None:
     """Create a minimal black PPM image (mpv will scale it to fullscreen)."""
     ppm_path = path.parent / IDLE_IMAGE_FALLBACK
     ppm_header = b"P6\n1920 1080\n255\n"
-    ppm_data = ppm_header + (b"\x00\x00\x00" * (1920 * 1080))
-    ppm_path.write_bytes(ppm_data)
+    with open(ppm_path, "wb") as f:
+        f.write(ppm_header)
+        # Extending the file zero-fills the pixel data without allocating it in memory
+        f.truncate(len(ppm_header) + 1920 * 1080 * 3)
     logger.info("Created minimal black idle image at %s", ppm_path)
@@ -6,13 +6,13 @@ import logging
 import signal
 import sys
 import time
-from queue import Empty, Queue
+from queue import Queue
 
 from .audio import play_error, play_success
-from .config import get_db_path, load_config
+from .config import close_connections, get_db_path, load_config
 from .debug_log import add as debug_add
 from .debug_log import run_osd_updater
-from .rate_limiter import check_rate_limit, record_view
+from .rate_limiter import record_view_if_allowed
 from .scanner_listener import start_scanner_listener_thread
 from .url_parser import parse_video_url
 from .video_service import (
@@ -32,9 +32,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Queued by the mpv watcher threads so the main loop re-checks the mpv processes
+_MPV_DIED = object()
+
 
 def _process_scan(url: str, db_path, mpv_sockets: list[str]) -> None:
-    """Handle a scanned URL: parse, rate limit, download, play, record."""
+    """Handle a scanned URL: parse, record against the rate limit, download, play."""
     debug_add(f"Scanned: {url[:60]}...")
 
     parsed = parse_video_url(url)
@@ -44,7 +47,8 @@ def _process_scan(url: str, db_path, mpv_sockets: list[str]) -> None:
         play_error()
         return
 
-    if not check_rate_limit():
+    # Check and record in one transaction; the view counts from the scan on, even if download or playback fails
+    if not record_view_if_allowed(parsed.video_id, parsed.platform, parsed.original_url):
         logger.info("Rate limit exceeded, skipping: %s", parsed.original_url[:60])
         debug_add("Error: Rate limit exceeded")
         play_error()
@@ -54,7 +58,7 @@ def _process_scan(url: str, db_path, mpv_sockets: list[str]) -> None:
     debug_add("Downloading...")
 
     logger.info("Downloading: %s", parsed.original_url)
-    path = download_video(parsed.original_url)
+    path = download_video(parsed.original_url, video_id=parsed.video_id)
     if not path:
         logger.warning("Download failed for %s", parsed.original_url[:60])
         debug_add("Error: Download failed")
@@ -63,9 +67,7 @@ def _process_scan(url: str, db_path, mpv_sockets: list[str]) -> None:
 
     debug_add(f"Playing: {path.name}")
     logger.info("Playing: %s", path.name)
-    if play_video_with_mpv(path, ipc_sockets=mpv_sockets, wait=False):
-        record_view(parsed.video_id, parsed.platform, parsed.original_url)
-    else:
+    if not play_video_with_mpv(path, ipc_sockets=mpv_sockets, wait=False):
         logger.warning("Playback failed for %s", path.name)
         debug_add("Error: Playback failed")
         play_error()
@@ -75,7 +77,8 @@ def main() -> int:
     """Run the video player service."""
     config = load_config()
     db_path = get_db_path()
-    scan_queue: Queue = Queue()
+    # Holds only the latest scan; producers replace a pending scan instead of queueing behind it
+    scan_queue: Queue = Queue(maxsize=1)
 
     # Start web server in background
     import threading
@@ -147,30 +150,39 @@ def main() -> int:
             proc.terminate()
         for proc in mpv_procs:
             proc.wait(timeout=5)
+        # Raises SystemExit in the main thread; connections are closed by the finally below once
+        # the interrupted code has released _conn_lock (closing here could deadlock on it)
         sys.exit(0)
 
     signal.signal(signal.SIGINT, shutdown)
     signal.signal(signal.SIGTERM, shutdown)
 
-    # Main loop: process scanned URLs (replace mode: drain queue, only process most recent)
+    def watch_mpv(proc):
+        """Wake the main loop as soon as an mpv process exits."""
+        proc.wait()
+        # put_latest may evict this for a newer scan; the loop then wakes for that scan instead,
+        # and the poll at the top of the loop still catches the exit.
+        scan_queue.put(_MPV_DIED)
+
+    for proc in mpv_procs:
+        threading.Thread(target=watch_mpv, args=(proc,), daemon=True).start()
+
+    # Main loop: process scanned URLs (replace mode: the queue only ever holds the most recent)
     logger.info("Ready. Scan a QR code to play a video.")
-    while True:
-        try:
-            url = scan_queue.get(timeout=1.0)
-            # Drain queue so we only process the most recent scan (replace, don't queue)
-            while True:
-                try:
-                    url = scan_queue.get_nowait()
-                except Empty:
-                    break
-        except Empty:
-            # Check if any mpv died
+    try:
+        while True:
+            # An mpv exit wakes the loop via its watcher thread
             if any(p.poll() is not None for p in mpv_procs):
                 logger.error("mpv exited unexpectedly")
                 return 1
-            continue
 
-        _process_scan(url, db_path, mpv_sockets)
+            url = scan_queue.get()
+            if url is _MPV_DIED:
+                continue
+
+            _process_scan(url, db_path, mpv_sockets)
+    finally:
+        close_connections()
 
 
 if __name__ == "__main__":
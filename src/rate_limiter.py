@@ -7,7 +7,7 @@ from typing import Optional
 
 from .config import (
     AppConfig,
-    add_view,
+    check_and_record,
     count_views_since,
     get_db_path,
     load_config,
@@ -26,10 +26,17 @@ def check_rate_limit(config: Optional[AppConfig] = None) -> bool:
     return count < cfg.max_videos
 
 
-def record_view(
+def record_view_if_allowed(
     video_id: str,
     platform: str,
     original_url: Optional[str] = None,
-) -> None:
-    """Record a video view after successful playback."""
-    add_view(video_id, platform, original_url, get_db_path())
+    config: Optional[AppConfig] = None,
+) -> bool:
+    """
+    Atomically check the rate limit and record a view.
+
+    Returns True if the view was recorded, False if the limit was already reached.
+    """
+    cfg = config or load_config()
+    since = time.time() - (cfg.period_hours * 3600)
+    return check_and_record(video_id, platform, original_url, cfg.max_videos, since, get_db_path())
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
+import select
 import threading
-from queue import Queue
+from queue import Empty, Full, Queue
 from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
@@ -62,6 +63,13 @@ _KEY_TO_CHAR: dict[int, tuple[Optional[str], Optional[str]]] = {
     57: (" ", " "),
 }
 
+# Flat lookup indexed by key code (KEY_CNT entries), avoiding a dict lookup per event
+_KEY_CNT = 0x300
+_KEY_TABLE: list[tuple[Optional[str], Optional[str]]] = [(None, None)] * _KEY_CNT
+for _code, _chars in _KEY_TO_CHAR.items():
+    _KEY_TABLE[_code] = _chars
+del _code, _chars
+
 # Modifier key codes
 _KEY_LEFTSHIFT = 42
 _KEY_RIGHTSHIFT = 54
@@ -104,23 +112,17 @@ def _find_scanner_device(device_path: Optional[str] = None):
     return None
 
 
-def _decode_key_event(code: int, value: int, shift_pressed: bool) -> Optional[str]:
-    """
-    Decode a key event to a character.
-    Returns the character, or None for non-printable (e.g. Enter, modifier).
-    """
-    if code in (_KEY_LEFTSHIFT, _KEY_RIGHTSHIFT):
-        return None
-    if code in (_KEY_ENTER, _KEY_KPENTER):
-        return "\n"  # Use newline as scan complete signal
-    if value != 1:  # Only key press, not release
-        return None
-
-    mapping = _KEY_TO_CHAR.get(code)
-    if not mapping:
-        return None
-    normal, shifted = mapping
-    return shifted if shift_pressed and shifted else (normal or shifted)
+def put_latest(queue: Queue, item) -> None:
+    """Put item on a bounded queue, replacing the oldest queued item if the queue is full."""
+    while True:
+        try:
+            queue.put_nowait(item)
+            return
+        except Full:
+            try:
+                queue.get_nowait()
+            except Empty:
+                pass
 
 
 def run_scanner_listener(
@@ -132,7 +134,8 @@ def run_scanner_listener(
     Run the scanner listener in the current thread (blocking).
 
     Accumulates key events until Enter, then passes the full URL string to callback.
-    If queue is provided, also puts each scanned string on the queue.
+    If queue is provided, also puts each scanned string on the queue, replacing any
+    scan still waiting there.
     """
     from evdev import ecodes
 
@@ -148,31 +151,46 @@ def run_scanner_listener(
         return
 
     logger.info("Scanner listener started on device: %s", dev.name)
-    buffer: list[str] = []
+    buffer = bytearray()  # Key table is pure ASCII, so each char is one byte
     shift_pressed = False
 
+    # Hot names bound as locals; key decoding is inlined to avoid a call per event
+    ev_key = ecodes.EV_KEY
+    key_table = _KEY_TABLE
+    fds = [dev.fd]
+
     try:
-        for event in dev.read_loop():
-            if event.type != ecodes.EV_KEY:
-                continue
-
-            if event.code in (_KEY_LEFTSHIFT, _KEY_RIGHTSHIFT):
-                shift_pressed = event.value == 1
-                continue
-
-            char = _decode_key_event(event.code, event.value, shift_pressed)
-            if char is None:
-                continue
-
-            if char == "\n":
-                if buffer:
-                    url = "".join(buffer)
-                    buffer.clear()
-                    callback(url)
-                    if queue is not None:
-                        queue.put(url)
-            else:
-                buffer.append(char)
+        while True:
+            select.select(fds, [], [])
+            try:
+                # Handle every event the device has pending in one batch
+                for event in dev.read():
+                    if event.type != ev_key:
+                        continue
+
+                    code = event.code
+                    if code == _KEY_LEFTSHIFT or code == _KEY_RIGHTSHIFT:
+                        shift_pressed = event.value == 1
+                        continue
+
+                    # Enter (press or release) completes the scan
+                    if code == _KEY_ENTER or code == _KEY_KPENTER:
+                        if buffer:
+                            url = buffer.decode("ascii")
+                            buffer.clear()
+                            callback(url)
+                            if queue is not None:
+                                put_latest(queue, url)
+                        continue
+
+                    if event.value != 1:  # Only key press, not release
+                        continue
+                    normal, shifted = key_table[code]
+                    char = shifted if shift_pressed and shifted else (normal or shifted)
+                    if char is not None:
+                        buffer.append(ord(char))
+            except BlockingIOError:
+                continue  # Woken without pending events
     except (IOError, OSError) as e:
         logger.error("Scanner device error: %s", e)
     finally:
@@ -190,10 +208,10 @@ def start_scanner_listener_thread(
     """
     Start the scanner listener in a background thread.
 
-    Returns (thread, queue). The queue receives each scanned URL string.
+    Returns (thread, queue). The queue holds the most recent unprocessed scan.
     """
     if queue is None:
-        queue = Queue()
+        queue = Queue(maxsize=1)
     thread = threading.Thread(
         target=run_scanner_listener,
         args=(callback, device_path, queue),
@@ -2,18 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from typing import Optional
-from urllib.parse import parse_qs, urlparse
 
 # YouTube video ID: 11 chars, alphanumeric + underscore + hyphen
-YOUTUBE_VIDEO_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{11}$")
+_YOUTUBE_VIDEO_ID = r"[a-zA-Z0-9_-]{11}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedVideo:
-    """Parsed video from a supported platform URL."""
+    """Parsed video from a supported platform URL. Immutable, as instances are shared by the parse cache."""
 
     platform: str
     video_id: str
@@ -24,72 +24,48 @@ class PlatformHandler:
     """Interface for platform-specific URL parsers."""
 
     def can_handle(self, url: str) -> bool:
-        """Return True if this handler can parse the given URL."""
-        raise NotImplementedError
+        """
+        Return True if this handler can parse the given URL.
+
+        Deprecated: parse_video_url only calls parse(). Kept for existing handlers and callers.
+        """
+        return self.parse(url) is not None
 
     def parse(self, url: str) -> Optional[ParsedVideo]:
-        """Parse URL and return ParsedVideo, or None if invalid."""
+        """Parse URL and return ParsedVideo, or None if unrecognized or invalid. Must be cheap for other URLs."""
         raise NotImplementedError
 
 
 class YouTubeHandler(PlatformHandler):
     """Parse YouTube URLs and extract video ID."""
 
-    # Patterns for YouTube URLs we support
-    _WATCH_PATTERNS = (
-        "youtube.com/watch",
-        "www.youtube.com/watch",
-        "m.youtube.com/watch",
+    # Recognizes watch, embed and youtu.be URLs (any subdomain included via search)
+    _RECOGNIZE_RE = re.compile(r"youtube\.com/(?:watch|embed/)|youtu\.be/", re.IGNORECASE)
+
+    # Matches and validates a full URL in one pass:
+    # youtube.com/watch?...v=ID, youtube.com/embed/ID, youtu.be/ID on any subdomain, optionally followed by
+    # ?, &, # or /. Only scheme and host are case-insensitive; path and query keys are not.
+    # The query prefix before v= is lazy so the first v= wins, as with parse_qs and yt-dlp.
+    _EXTRACT_RE = re.compile(
+        r"^(?i:https?://(?:[\w-]+\.)*)(?:"
+        rf"(?i:youtube\.com)/(?:watch/?\?(?:[^#]*?&)??v=(?P<watch_id>{_YOUTUBE_VIDEO_ID})"
+        rf"|embed/(?P<embed_id>{_YOUTUBE_VIDEO_ID}))"
+        rf"|(?i:youtu\.be)/(?P<short_id>{_YOUTUBE_VIDEO_ID})"
+        r")(?:[?&#/].*)?$"
     )
-    _SHORT_PATTERN = "youtu.be/"
-    _EMBED_PATTERN = "youtube.com/embed/"
 
     def can_handle(self, url: str) -> bool:
-        url_lower = url.lower().strip()
-        if any(p in url_lower for p in self._WATCH_PATTERNS):
-            return True
-        if self._SHORT_PATTERN in url_lower:
-            return True
-        if self._EMBED_PATTERN in url_lower:
-            return True
-        return False
+        return self._RECOGNIZE_RE.search(url) is not None
 
     def parse(self, url: str) -> Optional[ParsedVideo]:
-        url = url.strip()
-        if not url:
-            return None
-
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.netloc:
-            return None
-
-        video_id: Optional[str] = None
-
-        # youtu.be/VIDEO_ID
-        if "youtu.be" in parsed.netloc:
-            path = parsed.path.strip("/")
-            if path and "?" not in path.split("/")[0]:
-                video_id = path.split("/")[0].split("?")[0]
-
-        # youtube.com/embed/VIDEO_ID
-        elif "youtube.com" in parsed.netloc and "/embed/" in parsed.path:
-            parts = parsed.path.split("/embed/")
-            if len(parts) >= 2:
-                video_id = parts[1].split("/")[0].split("?")[0]
-
-        # youtube.com/watch?v=VIDEO_ID
-        elif "youtube.com" in parsed.netloc and "watch" in parsed.path:
-            qs = parse_qs(parsed.query)
-            if "v" in qs and qs["v"]:
-                video_id = qs["v"][0]
-
-        if not video_id or not YOUTUBE_VIDEO_ID_RE.match(video_id):
+        m = self._EXTRACT_RE.match(url.strip())
+        if not m:
             return None
 
         return ParsedVideo(
             platform="youtube",
-            video_id=video_id,
-            original_url=url,
+            video_id=m.group("watch_id") or m.group("embed_id") or m.group("short_id"),
+            original_url=m.string,
         )
 
 
@@ -100,6 +76,17 @@ _PLATFORM_HANDLERS: list[PlatformHandler] = [YouTubeHandler()]
 def register_handler(handler: PlatformHandler) -> None:
     """Register a platform handler for future expansion."""
     _PLATFORM_HANDLERS.append(handler)
+    _parse_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(url: str) -> Optional[ParsedVideo]:
+    """Run the registered handlers on a stripped URL. Memoized, since the same URLs are scanned repeatedly."""
+    for handler in _PLATFORM_HANDLERS:
+        result = handler.parse(url)
+        if result:
+            return result
+    return None
 
 
 def parse_video_url(url: str) -> Optional[ParsedVideo]:
@@ -111,11 +98,4 @@ def parse_video_url(url: str) -> Optional[ParsedVideo]:
     if not url or not isinstance(url, str):
         return None
 
-    url = url.strip()
-    for handler in _PLATFORM_HANDLERS:
-        if handler.can_handle(url):
-            result = handler.parse(url)
-            if result:
-                return result
-
-    return None
+    return _parse_cached(url.strip())
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import ctypes
+import itertools
 import json
 import logging
 import os
+import select
 import socket
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Optional, Union
 
 from .config import DEFAULT_CACHE_DIR
 
@@ -25,12 +30,12 @@ def load_idle_screen(
 
     sockets = ipc_sockets if ipc_sockets else [ipc_socket or MPV_IDLE_SOCKET]
     path = get_idle_image_path()
-    path_str = str(path.resolve())
+    loadfile_cmd = _loadfile_cmd(str(path.resolve()))
 
     for sock in sockets:
         # Set duration before load so image stays indefinitely (prevents idle loop)
         _mpv_ipc_send(sock, ["set_property", "image-display-duration", 2147483647])
-        resp = _mpv_ipc_send(sock, ["loadfile", path_str, "replace"])
+        resp = _mpv_ipc_send(sock, loadfile_cmd)
         if resp is None or resp.get("error") != "success":
             return False
     return True
@@ -40,6 +45,25 @@ YT_DLP_FORMAT = "best[height<=720]/best"
 MPV_IDLE_SOCKET = "/tmp/pi-videoplayer-mpv.sock"
 
 
+# Pooled IPC connections, one per mpv socket path. Each path has its own lock so
+# commands to different mpv instances (multi-HDMI) don't serialize on each other.
+_IPC_CONN_CACHE: dict[str, tuple[socket.socket, BinaryIO]] = {}
+_IPC_LOCKS: dict[str, threading.Lock] = {}
+_IPC_LOCKS_GUARD = threading.Lock()
+
+# Tags each pooled request so its reply can be told apart from events and earlier replies
+_IPC_REQUEST_IDS = itertools.count(1)
+
+# Pre-encoded fixed IPC commands (sent on every idle check / playback wait)
+_GET_IDLE_CMD = b'["get_property","idle-active"]'
+_OBSERVE_IDLE_MSG = b'{"command":["observe_property",1,"idle-active"]}\n'
+
+
+# Shared YoutubeDL instances keyed by cache dir; building one re-parses options and sets up logging
+_YDL_INSTANCES: dict[Path, Any] = {}
+_YDL_LOCK = threading.Lock()
+
+
 def _get_cache_dir() -> Path:
     """Return cache directory, creating it if needed."""
     cache = DEFAULT_CACHE_DIR
@@ -47,76 +71,161 @@ def _get_cache_dir() -> Path:
     return cache
 
 
-def download_video(url: str, cache_dir: Optional[Path] = None) -> Optional[Path]:
+def _find_cached_video(cache: Path, video_id: str) -> Optional[Path]:
+    """Return the completed cached file for video_id, ignoring partial downloads (e.g. ID.mp4.part)."""
+    for p in cache.glob(f"{video_id}.*"):
+        if p.stem == video_id and p.suffix not in (".part", ".ytdl") and p.is_file():
+            return p
+    return None
+
+
+def _get_ydl(cache: Path) -> Any:
+    """Return the shared YoutubeDL instance for cache, creating it on first use. Caller must hold _YDL_LOCK."""
+    ydl = _YDL_INSTANCES.get(cache)
+    if ydl is None:
+        import yt_dlp
+
+        ydl = yt_dlp.YoutubeDL(
+            {
+                "format": YT_DLP_FORMAT,
+                "outtmpl": str(cache / "%(id)s.%(ext)s"),
+                "quiet": True,
+                "no_warnings": True,
+            }
+        )
+        _YDL_INSTANCES[cache] = ydl
+    return ydl
+
+
+def download_video(
+    url: str,
+    cache_dir: Optional[Path] = None,
+    video_id: Optional[str] = None,
+) -> Optional[Path]:
     """
     Download video from URL using yt-dlp.
 
     Returns path to downloaded file, or None on failure.
-    Caches by video id; skips download if already cached.
+    Caches by video id; skips download if already cached. When video_id is known
+    (e.g. from ParsedVideo), a cache hit returns without starting yt-dlp at all.
     """
-    import yt_dlp
-
     cache = cache_dir or _get_cache_dir()
-    out_template = str(cache / "%(id)s.%(ext)s")
-
-    opts = {
-        "format": YT_DLP_FORMAT,
-        "outtmpl": out_template,
-        "quiet": True,
-        "no_warnings": True,
-    }
+    if video_id:
+        cached = _find_cached_video(cache, video_id)
+        if cached:
+            return cached
 
     try:
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(url, download=True)
-            if not info:
-                return None
-            video_id = info.get("id")
-            if not video_id:
-                return None
-            # Find the downloaded file (ext may differ after post-processing)
-            for p in cache.glob(f"{video_id}.*"):
-                if p.is_file():
-                    return p
-            path = cache / f"{video_id}.{info.get('ext', 'mp4')}"
-            return path if path.exists() else None
+        with _YDL_LOCK:
+            info = _get_ydl(cache).extract_info(url, download=True)
+        if not info:
+            return None
+        video_id = info.get("id")
+        if not video_id:
+            return None
+        # Expected file name first (one stat), then scan in case ext changed in post-processing
+        path = cache / f"{video_id}.{info.get('ext', 'mp4')}"
+        if path.is_file():
+            return path
+        return _find_cached_video(cache, video_id)
     except Exception as e:
-        logger.exception("yt-dlp download failed for %s: %s", url, e)
+        # Failures are usually expected (network, private video); only format tracebacks when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("yt-dlp download failed for %s: %s", url, e)
+        else:
+            logger.error("yt-dlp download failed for %s: %s", url, e)
         return None
 
     return None
 
 
-def _mpv_ipc_send(sock_path: str, command: list) -> Optional[dict]:
-    """Send a command to mpv via IPC socket, return response."""
+def _mpv_ipc_connect(sock_path: str, timeout: float) -> tuple[socket.socket, BinaryIO]:
+    """Connect to an mpv IPC socket. Returns the socket and a buffered reader on it."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.settimeout(5.0)
+        sock.settimeout(timeout)
         sock.connect(sock_path)
-        msg = json.dumps({"command": command}) + "\n"
-        sock.sendall(msg.encode())
-        # mpv sends newline-terminated JSON; read line by line (may receive events first)
-        with sock:
-            f = sock.makefile()
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    resp = json.loads(line)
-                    if "error" in resp:
-                        return resp
-                except json.JSONDecodeError:
-                    continue
-    except (socket.error, json.JSONDecodeError, OSError) as e:
-        logger.warning("mpv IPC error on %s: %s", sock_path, e)
+    except OSError:
+        sock.close()
+        raise
+    return sock, sock.makefile("rb")
+
+
+def _mpv_ipc_close(conn: tuple[socket.socket, BinaryIO]) -> None:
+    """Close a connection returned by _mpv_ipc_connect."""
+    sock, reader = conn
+    try:
+        reader.close()
+    finally:
+        sock.close()
+
+
+def _mpv_ipc_read_response(reader: BinaryIO, request_id: int) -> Optional[dict]:
+    """Read lines until the reply to request_id arrives, skipping events and other replies. None on EOF."""
+    for line in reader:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            resp = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if "event" not in resp and resp.get("request_id") == request_id:
+            return resp
+    return None
+
+
+def _mpv_ipc_lock(sock_path: str) -> threading.Lock:
+    """Return the lock guarding the pooled connection for sock_path."""
+    with _IPC_LOCKS_GUARD:
+        lock = _IPC_LOCKS.get(sock_path)
+        if lock is None:
+            lock = _IPC_LOCKS[sock_path] = threading.Lock()
+        return lock
+
+
+def _loadfile_cmd(path_str: str) -> bytes:
+    """Encode a loadfile-replace command; only the path needs JSON escaping."""
+    return b'["loadfile",%b,"replace"]' % json.dumps(path_str).encode()
+
+
+def _mpv_ipc_send(sock_path: str, command: Union[list, bytes]) -> Optional[dict]:
+    """
+    Send a command to mpv via IPC socket, return response. Reuses a pooled connection per socket.
+
+    command is either an argument list or an already JSON-encoded argument array.
+    """
+    encoded = command if isinstance(command, bytes) else json.dumps(command).encode()
+    error: Exception = ConnectionResetError("mpv closed the IPC socket")
+    with _mpv_ipc_lock(sock_path):
+        conn = _IPC_CONN_CACHE.pop(sock_path, None)
+        # A pooled connection may have gone stale (mpv restarted); retry once on a fresh one
+        for fresh in (False, True) if conn is not None else (True,):
+            try:
+                if fresh:
+                    conn = _mpv_ipc_connect(sock_path, 5.0)
+                request_id = next(_IPC_REQUEST_IDS)
+                conn[0].sendall(b'{"command":%b,"request_id":%d}\n' % (encoded, request_id))
+                # mpv sends newline-terminated JSON; read line by line (may receive events first)
+                resp = _mpv_ipc_read_response(conn[1], request_id)
+            except (OSError, ValueError) as e:
+                error = e
+                resp = None
+            if resp is not None:
+                _IPC_CONN_CACHE[sock_path] = conn
+                return resp
+            # Drop the connection so an unread reply can't be mistaken for the next response
+            if conn is not None:
+                _mpv_ipc_close(conn)
+                conn = None
+    logger.warning("mpv IPC error on %s: %s", sock_path, error)
     return None
 
 
 def _mpv_is_idle(sock_path: str) -> bool:
     """Check if mpv is currently idle (no playback)."""
     try:
-        resp = _mpv_ipc_send(sock_path, ["get_property", "idle-active"])
+        resp = _mpv_ipc_send(sock_path, _GET_IDLE_CMD)
         return resp is not None and resp.get("data") is True
     except Exception:
         return False
@@ -125,34 +234,47 @@ def _mpv_is_idle(sock_path: str) -> bool:
 def _mpv_ipc_wait_idle(sock_path: str, timeout: float = 3600) -> bool:
     """
     Wait until mpv is idle (playback finished).
-    Polls the idle-active property. Returns True when idle.
+    Observes the idle-active property over one connection and blocks until mpv
+    reports it true. Returns True when idle, False if the timeout expires.
     """
-    start = time.time()
-    while (time.time() - start) < timeout:
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
         try:
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.settimeout(2.0)
-            sock.connect(sock_path)
-            msg = json.dumps({"command": ["get_property", "idle-active"]}) + "\n"
-            sock.sendall(msg.encode())
-            with sock:
-                f = sock.makefile()
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        resp = json.loads(line)
-                        if "error" in resp and resp.get("data") is True:
-                            return True
-                        if "error" in resp:
-                            break
-                    except json.JSONDecodeError:
-                        continue
-        except (socket.error, OSError):
-            pass
-        time.sleep(0.5)
-    return False
+            conn = _mpv_ipc_connect(sock_path, min(remaining, 2.0))
+        except OSError:
+            time.sleep(min(remaining, 0.5))  # mpv not reachable yet; retry until the deadline
+            continue
+        sock, reader = conn
+        try:
+            sock.sendall(_OBSERVE_IDLE_MSG)
+            # mpv pushes the current value right away, then again on every change
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                sock.settimeout(remaining)
+                line = reader.readline()
+                if not line:
+                    break  # mpv closed the connection; reconnect
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if (
+                    event.get("event") == "property-change"
+                    and event.get("name") == "idle-active"
+                    and event.get("data") is True
+                ):
+                    return True
+        except TimeoutError:
+            return False
+        except OSError:
+            time.sleep(min(max(deadline - time.monotonic(), 0), 0.5))
+        finally:
+            _mpv_ipc_close(conn)
 
 
 def play_video_with_mpv(
@@ -170,10 +292,16 @@ def play_video_with_mpv(
     Returns True if loadfile succeeded, False on error.
     """
     sockets = ipc_sockets if ipc_sockets else [ipc_socket]
-    path_str = str(video_path.resolve())
+    loadfile_cmd = _loadfile_cmd(str(video_path.resolve()))
 
-    for sock in sockets:
-        resp = _mpv_ipc_send(sock, ["loadfile", path_str, "replace"])
+    if len(sockets) == 1:
+        responses = [_mpv_ipc_send(sockets[0], loadfile_cmd)]
+    else:
+        # Start all displays at once so they stay in sync (each socket has its own pooled connection)
+        with ThreadPoolExecutor(max_workers=len(sockets)) as executor:
+            responses = list(executor.map(lambda sock: _mpv_ipc_send(sock, loadfile_cmd), sockets))
+
+    for sock, resp in zip(sockets, responses):
         if resp is None:
             logger.warning("Could not send loadfile to mpv on %s", sock)
             return False
@@ -186,6 +314,56 @@ def play_video_with_mpv(
     return True
 
 
+_IN_CREATE = 0x100  # inotify: file created in watched directory
+
+
+def _inotify_watch_dirs(directories: set[str]) -> Optional[int]:
+    """Return a non-blocking inotify fd watching directories for new entries, or None if unavailable."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None  # Not Linux
+    if fd < 0:
+        return None
+    for directory in directories:
+        if libc.inotify_add_watch(fd, os.fsencode(directory), _IN_CREATE) < 0:
+            os.close(fd)
+            return None
+    return fd
+
+
+def _wait_for_sockets(paths: list[str], timeout: float = 5.0) -> set[str]:
+    """
+    Wait until all paths exist. Returns the paths still missing after timeout (empty on success).
+
+    On Linux, inotify wakes us as soon as something is created in a watched directory;
+    elsewhere falls back to checking every 100 ms.
+    """
+    deadline = time.monotonic() + timeout
+    missing = set(paths)
+    fd = _inotify_watch_dirs({os.path.dirname(p) or "." for p in missing})
+    try:
+        while True:
+            # Checked after the watch is in place, so a socket created in between isn't missed
+            missing = {p for p in missing if not os.path.exists(p)}
+            if not missing:
+                return missing
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return missing
+            if fd is None:
+                time.sleep(min(remaining, 0.1))
+            elif select.select([fd], [], [], remaining)[0]:
+                try:
+                    os.read(fd, 4096)  # Discard events; any creation triggers the re-check above
+                except BlockingIOError:
+                    pass
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+
 def start_mpv_idle(
     ipc_socket: str = MPV_IDLE_SOCKET,
     display_connectors: Optional[list[str]] = None,
@@ -203,7 +381,8 @@ def start_mpv_idle(
     procs: list[subprocess.Popen] = []
 
     if connectors:
-        # Multi-HDMI: one mpv per connector
+        # Multi-HDMI: one mpv per connector. Start them all first, then wait for the sockets.
+        started_connectors: list[str] = []
         for i, conn in enumerate(connectors):
             conn = conn.strip()
             if not conn:
@@ -235,18 +414,9 @@ def start_mpv_idle(
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.PIPE,
                 )
-                for _ in range(50):
-                    if os.path.exists(sock):
-                        procs.append(proc)
-                        sockets.append(sock)
-                        break
-                    time.sleep(0.1)
-                else:
-                    proc.terminate()
-                    logger.error("mpv did not create IPC socket for %s in time", conn)
-                    for p in procs:
-                        p.terminate()
-                    return None
+                procs.append(proc)
+                sockets.append(sock)
+                started_connectors.append(conn)
             except FileNotFoundError:
                 logger.error("mpv not found. Install with: apt install mpv")
                 for p in procs:
@@ -257,6 +427,16 @@ def start_mpv_idle(
                 for p in procs:
                     p.terminate()
                 return None
+
+        # All instances start in parallel; wait for their sockets together
+        missing = _wait_for_sockets(sockets)
+        if missing:
+            for conn, sock in zip(started_connectors, sockets):
+                if sock in missing:
+                    logger.error("mpv did not create IPC socket for %s in time", conn)
+            for p in procs:
+                p.terminate()
+            return None
     else:
         # Single display: default behavior
         if os.path.exists(ipc_socket):
@@ -283,10 +463,8 @@ def start_mpv_idle(
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
             )
-            for _ in range(50):
-                if os.path.exists(ipc_socket):
-                    return ([proc], [ipc_socket])
-                time.sleep(0.1)
+            if not _wait_for_sockets([ipc_socket]):
+                return ([proc], [ipc_socket])
             proc.terminate()
             logger.error("mpv did not create IPC socket in time")
             return None
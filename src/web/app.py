@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from pathlib import Path
 from queue import Queue
 from typing import Optional
 from urllib.parse import unquote
 
-from flask import Flask, redirect, render_template_string, request, url_for
+from flask import Flask, redirect, render_template, request, url_for
 
 from ..config import (
     AppConfig,
@@ -17,6 +18,7 @@ from ..config import (
     load_config,
     save_config,
 )
+from ..scanner_listener import put_latest
 
 logger = logging.getLogger(__name__)
 
@@ -137,10 +139,7 @@ SETTINGS_TEMPLATE = """
 """
 
 
-def _format_timestamp(ts: float) -> str:
-    from datetime import datetime
-
-    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
 
 
 def create_app(
@@ -151,21 +150,26 @@ def create_app(
     app = Flask(__name__)
     app.secret_key = "pi-videokiosk-secret"  # Fixed key for local kiosk use
 
+    # Compile templates once; render_template_string would re-parse them on every request
+    dashboard_template = app.jinja_env.from_string(DASHBOARD_TEMPLATE)
+    settings_template = app.jinja_env.from_string(SETTINGS_TEMPLATE)
+
     def _queue_url(url: str) -> bool:
         """Queue a URL for playback. Returns True if queued."""
         if not scan_queue or not url or not url.strip():
             return False
-        scan_queue.put(url.strip())
+        put_latest(scan_queue, url.strip())
         return True
 
     @app.route("/")
     def dashboard():
         config = load_config(config_path)
         recent = get_recent_views(50, config_path)
-        for v in recent:
-            v["viewed_at_fmt"] = _format_timestamp(v["viewed_at"])
-        return render_template_string(
-            DASHBOARD_TEMPLATE,
+        fromtimestamp = datetime.fromtimestamp
+        for v in recent:  # Fresh dicts from get_recent_views, safe to annotate in place
+            v["viewed_at_fmt"] = fromtimestamp(v["viewed_at"]).strftime(_TIMESTAMP_FORMAT)
+        return render_template(
+            dashboard_template,
             config=config,
             recent_views=recent,
         )
@@ -187,7 +191,7 @@ def create_app(
                 return redirect(url_for("dashboard"))
             except (ValueError, TypeError) as e:
                 logger.warning("Invalid settings: %s", e)
-        return render_template_string(SETTINGS_TEMPLATE, config=config)
+        return render_template(settings_template, config=config)
 
     @app.route("/play", methods=["POST"])
     def play():
@@ -1,6 +1,8 @@
 """Tests for config module."""
 
+import sqlite3
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -8,8 +10,11 @@ import pytest
 from src.config import (
     AppConfig,
     add_view,
+    check_and_record,
+    close_connections,
     count_views_since,
     get_recent_views,
+    invalidate_config_cache,
     load_config,
     save_config,
 )
@@ -22,6 +27,7 @@ def temp_db():
         db_path = Path(tmp) / "test.db"
         (db_path.parent / "cache").mkdir(exist_ok=True)
         yield db_path
+        close_connections()
 
 
 def test_load_config_defaults(temp_db):
@@ -71,3 +77,50 @@ def test_get_recent_views(temp_db):
     recent = get_recent_views(10, temp_db)
     assert len(recent) == 2
     assert recent[0]["video_id"] == "b"  # Most recent first
+
+
+def test_database_uses_wal_journal(temp_db):
+    """Database file is switched to WAL journaling on first use."""
+    load_config(temp_db)
+    conn = sqlite3.connect(temp_db)
+    mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.close()
+    assert mode == "wal"
+
+
+def test_shared_connection_usable_across_threads(temp_db):
+    """The shared connection can be used from threads other than the one that opened it."""
+    add_view("a", "youtube", None, temp_db)
+    errors = []
+
+    def worker():
+        try:
+            add_view("b", "youtube", None, temp_db)
+        except Exception as e:
+            errors.append(e)
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join()
+    assert not errors
+    assert count_views_since(0, temp_db) == 2
+
+
+def test_check_and_record_respects_limit(temp_db):
+    """Views are recorded until the limit is reached, then rejected."""
+    assert check_and_record("a", "youtube", None, 2, 0, temp_db) is True
+    assert check_and_record("b", "youtube", None, 2, 0, temp_db) is True
+    assert check_and_record("c", "youtube", None, 2, 0, temp_db) is False
+    assert count_views_since(0, temp_db) == 2
+
+
+def test_load_config_cached_until_invalidated(temp_db):
+    """Config is served from memory; external DB edits show up after invalidation."""
+    assert load_config(temp_db).max_videos == 3
+    conn = sqlite3.connect(temp_db)
+    conn.execute("INSERT OR REPLACE INTO config (key, value) VALUES ('max_videos', '7')")
+    conn.commit()
+    conn.close()
+    assert load_config(temp_db).max_videos == 3
+    invalidate_config_cache()
+    assert load_config(temp_db).max_videos == 7
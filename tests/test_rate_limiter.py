@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
-from src.config import AppConfig, add_view, save_config
+from src.config import AppConfig, add_view, close_connections, save_config
 from src.rate_limiter import check_rate_limit
 
 
@@ -17,6 +17,7 @@ def temp_db():
         db_path = Path(tmp) / "test.db"
         (db_path.parent / "cache").mkdir(exist_ok=True)
         yield db_path
+        close_connections()
 
 
 def test_rate_limit_allows_when_under_limit(temp_db):
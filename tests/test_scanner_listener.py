@@ -0,0 +1,22 @@
+"""Tests for scanner_listener module."""
+
+from queue import Queue
+
+from src.scanner_listener import put_latest
+
+
+def test_put_latest_puts_on_empty_queue():
+    """An empty queue simply receives the item."""
+    queue: Queue = Queue(maxsize=1)
+    put_latest(queue, "https://youtu.be/dQw4w9WgXcQ")
+    assert queue.get_nowait() == "https://youtu.be/dQw4w9WgXcQ"
+
+
+def test_put_latest_replaces_pending_item():
+    """A full queue ends up holding only the newest item."""
+    queue: Queue = Queue(maxsize=1)
+    put_latest(queue, "https://youtu.be/aaaaaaaaaaa")
+    put_latest(queue, "https://youtu.be/bbbbbbbbbbb")
+    put_latest(queue, "https://youtu.be/dQw4w9WgXcQ")
+    assert queue.qsize() == 1
+    assert queue.get_nowait() == "https://youtu.be/dQw4w9WgXcQ"
@@ -1,6 +1,6 @@
 """Tests for url_parser module."""
 
-from src.url_parser import parse_video_url
+from src.url_parser import YouTubeHandler, parse_video_url
 
 
 class TestYouTubeHandler:
@@ -41,6 +41,36 @@ class TestYouTubeHandler:
         assert result is not None
         assert result.video_id == "dQw4w9WgXcQ"
 
+    def test_extra_query_parameters(self):
+        result = parse_video_url("https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ&t=42")
+        assert result is not None
+        assert result.video_id == "dQw4w9WgXcQ"
+        result = parse_video_url("https://youtu.be/dQw4w9WgXcQ?si=abc")
+        assert result is not None
+        assert result.video_id == "dQw4w9WgXcQ"
+
+    def test_duplicate_v_parameter_uses_first(self):
+        result = parse_video_url("https://youtube.com/watch?v=dQw4w9WgXcQ&v=aaaaaaaaaaa")
+        assert result is not None
+        assert result.video_id == "dQw4w9WgXcQ"
+
+    def test_other_subdomains(self):
+        for host in ("music.youtube.com", "gaming.youtube.com", "WWW.YouTube.com"):
+            result = parse_video_url(f"https://{host}/watch?v=dQw4w9WgXcQ")
+            assert result is not None
+            assert result.video_id == "dQw4w9WgXcQ"
+
+    def test_watch_with_trailing_slash(self):
+        result = parse_video_url("https://youtube.com/watch/?v=dQw4w9WgXcQ")
+        assert result is not None
+        assert result.video_id == "dQw4w9WgXcQ"
+
+    def test_query_key_is_case_sensitive(self):
+        assert parse_video_url("https://www.youtube.com/watch?V=dQw4w9WgXcQ") is None
+
+    def test_invalid_video_id_too_long(self):
+        assert parse_video_url("https://www.youtube.com/watch?v=dQw4w9WgXcQx") is None
+
     def test_invalid_video_id_too_short(self):
         url = "https://www.youtube.com/watch?v=short"
         result = parse_video_url(url)
@@ -60,3 +90,14 @@ class TestYouTubeHandler:
         assert parse_video_url("") is None
         assert parse_video_url("not a url") is None
         assert parse_video_url("https://example.com") is None
+
+    def test_can_handle(self):
+        handler = YouTubeHandler()
+        assert handler.can_handle("https://WWW.YouTube.com/watch?v=dQw4w9WgXcQ")
+        assert handler.can_handle("https://youtu.be/dQw4w9WgXcQ")
+        assert handler.can_handle("https://m.youtube.com/embed/dQw4w9WgXcQ")
+        assert not handler.can_handle("https://vimeo.com/123456789")
+
+    def test_repeated_url_returns_cached_result(self):
+        url = "https://youtu.be/dQw4w9WgXcQ"
+        assert parse_video_url(url) is parse_video_url(" " + url)
@@ -0,0 +1,110 @@
+"""Tests for video_service module."""
+
+import json
+import socket
+import threading
+
+import pytest
+
+from src.video_service import _IPC_CONN_CACHE, _find_cached_video, _mpv_ipc_close, _mpv_ipc_send, download_video
+
+
+@pytest.fixture
+def fake_mpv(tmp_path):
+    """Start a fake mpv IPC server; replies(request) gives the lines sent back for each request."""
+    sock_path = str(tmp_path / "mpv.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(sock_path)
+    server.listen()
+    accepted = []
+
+    def start(replies, requests_per_conn=None):
+        def serve():
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                accepted.append(conn)
+                with conn, conn.makefile("rb") as reader:
+                    for n, line in enumerate(reader, 1):
+                        lines = replies(json.loads(line))
+                        conn.sendall(b"".join(json.dumps(r).encode() + b"\n" for r in lines))
+                        if requests_per_conn and n >= requests_per_conn:
+                            break
+
+        threading.Thread(target=serve, daemon=True).start()
+        return sock_path, accepted
+
+    yield start
+    conn = _IPC_CONN_CACHE.pop(sock_path, None)
+    if conn is not None:
+        _mpv_ipc_close(conn)
+    server.close()
+
+
+def _reply(request, data):
+    return {"data": data, "error": "success", "request_id": request["request_id"]}
+
+
+def test_find_cached_video_returns_completed_file(tmp_path):
+    """A finished ID.mp4 is a cache hit."""
+    video = tmp_path / "dQw4w9WgXcQ.mp4"
+    video.write_bytes(b"")
+    assert _find_cached_video(tmp_path, "dQw4w9WgXcQ") == video
+
+
+def test_find_cached_video_ignores_partial_download(tmp_path):
+    """ID.mp4.part alone is not a cache hit."""
+    (tmp_path / "dQw4w9WgXcQ.mp4.part").write_bytes(b"")
+    assert _find_cached_video(tmp_path, "dQw4w9WgXcQ") is None
+
+
+def test_find_cached_video_ignores_format_fragment(tmp_path):
+    """ID.f137.mp4 (an unmerged format stream) is not a cache hit."""
+    (tmp_path / "dQw4w9WgXcQ.f137.mp4").write_bytes(b"")
+    assert _find_cached_video(tmp_path, "dQw4w9WgXcQ") is None
+
+
+def test_download_video_cache_hit_skips_yt_dlp(tmp_path):
+    """With a known video_id, a cached file is returned without starting yt-dlp."""
+    video = tmp_path / "dQw4w9WgXcQ.webm"
+    video.write_bytes(b"")
+    url = "https://youtu.be/dQw4w9WgXcQ"
+    assert download_video(url, tmp_path, video_id="dQw4w9WgXcQ") == video
+
+
+def test_mpv_ipc_send_skips_events_before_reply(fake_mpv):
+    """Events, including old mpv end-file events carrying an error key, are not taken as the reply."""
+    sock_path, _ = fake_mpv(
+        lambda req: [
+            {"event": "end-file", "reason": "error", "error": "loading failed"},
+            {"event": "idle"},
+            _reply(req, True),
+        ]
+    )
+    resp = _mpv_ipc_send(sock_path, ["get_property", "idle-active"])
+    assert resp is not None
+    assert resp["data"] is True
+
+
+def test_mpv_ipc_send_skips_reply_to_other_request(fake_mpv):
+    """A reply tagged with a different request_id is skipped."""
+    sock_path, _ = fake_mpv(
+        lambda req: [
+            {"data": "stale", "error": "success", "request_id": req["request_id"] - 1},
+            _reply(req, "fresh"),
+        ]
+    )
+    resp = _mpv_ipc_send(sock_path, ["get_property", "path"])
+    assert resp is not None
+    assert resp["data"] == "fresh"
+
+
+def test_mpv_ipc_send_reconnects_stale_pooled_connection(fake_mpv):
+    """If mpv closed the pooled connection, the command is retried once on a fresh one."""
+    sock_path, accepted = fake_mpv(lambda req: [_reply(req, req["command"][1])], requests_per_conn=1)
+    assert _mpv_ipc_send(sock_path, ["get_property", "first"])["data"] == "first"
+    assert sock_path in _IPC_CONN_CACHE
+    assert _mpv_ipc_send(sock_path, ["get_property", "second"])["data"] == "second"
+    assert len(accepted) == 2